@@ -52,6 +52,102 @@ export const TransactionStatus = Object.freeze({
     PROCESSING: 'processing'
 });
 
+// Tablas valor -> constante canónica del enum, precalculadas una sola vez.
+// Sirven para validar en O(1) y para que todas las instancias compartan el
+// mismo string en lugar de copias iguales (p.ej. desde JSON.parse)
+const CURRENCY_LOOKUP = new Map(Object.values(Currency).map(v => [v, v]));
+const PAYMENT_METHOD_LOOKUP = new Map(Object.values(PaymentMethod).map(v => [v, v]));
+const TRANSACTION_STATUS_LOOKUP = new Map(Object.values(TransactionStatus).map(v => [v, v]));
+
+/**
+ * Return the canonical enum constant equal to value (unknown values pass through)
+ * @param {Map<string, string>} lookup
+ * @param {string} value
+ * @returns {string}
+ */
+function internEnumValue(lookup, value) {
+    return lookup.get(value) ?? value;
+}
+
+/**
+ * Convert a timestamp (epoch ms, Date or date string) to epoch milliseconds
+ * @param {number|Date|string} value
+ * @returns {number}
+ */
+function toEpochMs(value) {
+    if (typeof value === 'number') return value;
+    return value instanceof Date ? value.getTime() : new Date(value).getTime();
+}
+
+
+// ==================== TAG REGISTRY ====================
+
+// Arrays vacíos compartidos: los registros sin tags no reservan memoria extra
+const EMPTY_TAG_IDS = Object.freeze([]);
+const EMPTY_TAGS = Object.freeze([]);
+
+/**
+ * Interns tag names to small integer ids shared by all transactions.
+ * Los ids solo son válidos durante la sesión; al serializar se guardan los nombres.
+ */
+export class TagRegistry {
+    static #toId = new Map();
+    static #toName = [];
+
+    /**
+     * Get the id for a tag name, registering it if new
+     * @param {string} name
+     * @returns {number}
+     */
+    static intern(name) {
+        let id = TagRegistry.#toId.get(name);
+        if (id === undefined) {
+            id = TagRegistry.#toName.length;
+            TagRegistry.#toName.push(name);
+            TagRegistry.#toId.set(name, id);
+        }
+        return id;
+    }
+
+    /**
+     * Intern a list of tag names into a frozen array of ids
+     * @param {string[]|null|undefined} names
+     * @returns {ReadonlyArray<number>}
+     */
+    static internAll(names) {
+        if (!names || names.length === 0) return EMPTY_TAG_IDS;
+        return Object.freeze(names.map(TagRegistry.intern));
+    }
+
+    /**
+     * Freeze a list of tag ids from this session (e.g. another record's tagIds)
+     * @param {number[]|ReadonlyArray<number>} ids
+     * @returns {ReadonlyArray<number>}
+     */
+    static freezeIds(ids) {
+        if (ids.length === 0) return EMPTY_TAG_IDS;
+        return Object.isFrozen(ids) ? ids : Object.freeze([...ids]);
+    }
+
+    /**
+     * Get the id of an already registered tag
+     * @param {string} name
+     * @returns {number|undefined}
+     */
+    static idOf(name) {
+        return TagRegistry.#toId.get(name);
+    }
+
+    /**
+     * Get the tag name for an id
+     * @param {number} id
+     * @returns {string}
+     */
+    static nameOf(id) {
+        return TagRegistry.#toName[id];
+    }
+}
+
 
 // ==================== CORE TRANSACTION MODELS ====================
 
@@ -64,7 +160,9 @@ export class Income {
      * @param {number} data.id - Unique identifier
      * @param {number} data.userId - Owner of this income record
      * @param {Date|string} data.date - Date received or expected
-     * @param {number} data.amount - Total amount
+     * @param {number} [data.amountCents] - Total amount in cents (smallest unit)
+     * @param {number} [data.amount] - Total amount, used when amountCents is not given;
+     *     rounded to the nearest cent (10.555 -> 1056, 0.004 -> 0 and rejected)
      * @param {string} data.name - Descriptive name of income source
      * @param {number} data.categoryId - Foreign key to Category
      * @param {number} data.accountId - Foreign key to Account
@@ -78,15 +176,19 @@ export class Income {
      * @param {number|null} [data.convertedAmount=null] - Amount in account's currency
      * @param {string|null} [data.attachmentUrl=null] - Link to receipt
      * @param {string[]} [data.tags=[]] - Custom tags for filtering
+     * @param {number[]} [data.tagIds] - Interned tag ids; take precedence over tags
      * @param {string} [data.notes=''] - Internal notes
      * @param {number|null} [data.recurringTemplateId=null] - Template FK
+     * @param {Object} [options]
+     * @param {boolean} [options.validate=true] - Set false for rows already
+     *     validated in bulk (e.g. by TransactionTable.fromRecords)
      */
-    constructor(data) {
+    constructor(data, { validate = true } = {}) {
         // Required fields
         this.id = data.id;
         this.userId = data.userId;
         this.date = data.date instanceof Date ? data.date : new Date(data.date);
-        this.amount = data.amount;
+        this.amountCents = data.amountCents ?? Math.round(data.amount * 100);
         this.name = data.name;
         this.categoryId = data.categoryId;
         this.accountId = data.accountId;
@@ -95,8 +197,8 @@ export class Income {
         this.description = data.description ?? '';
         this.recurring = data.recurring ?? false;
         this.dayIncome = data.dayIncome ?? null;
-        this.paymentMethod = data.paymentMethod ?? PaymentMethod.TRANSFER;
-        this.currency = data.currency ?? Currency.USD;
+        this.paymentMethod = internEnumValue(PAYMENT_METHOD_LOOKUP, data.paymentMethod ?? PaymentMethod.TRANSFER);
+        this.currency = internEnumValue(CURRENCY_LOOKUP, data.currency ?? Currency.USD);
         this.received = data.received ?? false;
 
         // Currency conversion
@@ -105,17 +207,20 @@ export class Income {
 
         // Additional metadata
         this.attachmentUrl = data.attachmentUrl ?? null;
-        this.tags = data.tags ?? [];
+        this.tagIds = data.tagIds !== undefined
+            ? TagRegistry.freezeIds(data.tagIds)
+            : TagRegistry.internAll(data.tags);
         this.notes = data.notes ?? '';
         this.recurringTemplateId = data.recurringTemplateId ?? null;
 
         // Audit fields
-        this.createdAt = data.createdAt ? new Date(data.createdAt) : new Date();
-        this.updatedAt = data.updatedAt ? new Date(data.updatedAt) : new Date();
+        // Guardados como epoch ms; createdAt/updatedAt crean el Date solo al leerlos
+        this.createdAtMs = data.createdAtMs ?? (data.createdAt ? toEpochMs(data.createdAt) : Date.now());
+        this.updatedAtMs = data.updatedAtMs ?? (data.updatedAt ? toEpochMs(data.updatedAt) : Date.now());
         this.isActive = data.isActive ?? true;
 
         // Validate after setting all fields
-        this.#validate();
+        if (validate) this.#validate();
     }
 
     /**
@@ -123,17 +228,109 @@ export class Income {
      * El # hace el método privado (solo accesible dentro de la clase)
      */
     #validate() {
-        if (this.amount <= 0) {
-            throw new Error('Income amount must be greater than 0');
-        }
-        if (this.dayIncome !== null && (this.dayIncome < 1 || this.dayIncome > 31)) {
-            throw new Error('dayIncome must be between 1 and 31');
-        }
-        if (this.recurring && this.dayIncome === null) {
+        const day = this.dayIncome;
+
+        // Cada regla se evalúa una sola vez; los registros válidos salen con una comprobación
+        const badAmount = this.amountCents <= 0;
+        const fractionalCents = !Number.isInteger(this.amountCents);
+        const badDay = day !== null && (day < 1 || day > 31);
+        const missingDay = this.recurring && day === null;
+
+        if (badAmount || fractionalCents || badDay || missingDay) {
+            if (badAmount) {
+                throw new Error('Income amount must be greater than 0');
+            }
+            if (fractionalCents) {
+                throw new Error('Income amountCents must be a whole number of cents');
+            }
+            if (badDay) {
+                throw new Error('dayIncome must be between 1 and 31');
+            }
             throw new Error('dayIncome is required for recurring income');
         }
     }
 
+    /**
+     * Amount in major units, derived from amountCents
+     * @returns {number}
+     */
+    get amount() {
+        return this.amountCents / 100;
+    }
+
+    set amount(value) {
+        this.amountCents = Math.round(value * 100);
+    }
+
+    /**
+     * @returns {Date}
+     */
+    get createdAt() {
+        return new Date(this.createdAtMs);
+    }
+
+    set createdAt(value) {
+        this.createdAtMs = toEpochMs(value);
+    }
+
+    /**
+     * @returns {Date}
+     */
+    get updatedAt() {
+        return new Date(this.updatedAtMs);
+    }
+
+    set updatedAt(value) {
+        this.updatedAtMs = toEpochMs(value);
+    }
+
+    /**
+     * Tag names, resolved from tagIds. Always frozen: use addTag/removeTag
+     * (or assign a new array) to change them
+     * @returns {ReadonlyArray<string>}
+     */
+    get tags() {
+        if (this.tagIds.length === 0) return EMPTY_TAGS;
+        return Object.freeze(this.tagIds.map(TagRegistry.nameOf));
+    }
+
+    set tags(names) {
+        this.tagIds = TagRegistry.internAll(names);
+    }
+
+    /**
+     * Add a tag (no-op if already present)
+     * @param {string} name
+     */
+    addTag(name) {
+        const id = TagRegistry.intern(name);
+        if (this.tagIds.includes(id)) return;
+        this.tagIds = Object.freeze([...this.tagIds, id]);
+        this.updatedAtMs = Date.now();
+    }
+
+    /**
+     * Remove a tag (no-op if not present)
+     * @param {string} name
+     */
+    removeTag(name) {
+        const id = TagRegistry.idOf(name);
+        if (id === undefined || !this.tagIds.includes(id)) return;
+        const remaining = this.tagIds.filter(tagId => tagId !== id);
+        this.tagIds = remaining.length === 0 ? EMPTY_TAG_IDS : Object.freeze(remaining);
+        this.updatedAtMs = Date.now();
+    }
+
+    /**
+     * Check if this record has a tag
+     * @param {string} name
+     * @returns {boolean}
+     */
+    hasTag(name) {
+        const id = TagRegistry.idOf(name);
+        return id !== undefined && this.tagIds.includes(id);
+    }
+
     /**
      * Calculate amount in account's currency
      * @param {number} rate - Exchange rate
@@ -150,7 +347,7 @@ export class Income {
      */
     markAsReceived() {
         this.received = true;
-        this.updatedAt = new Date();
+        this.updatedAtMs = Date.now();
     }
 
     /**
@@ -162,7 +359,7 @@ export class Income {
             id: this.id,
             userId: this.userId,
             date: this.date.toISOString(),
-            amount: this.amount,
+            amountCents: this.amountCents,
             name: this.name,
             categoryId: this.categoryId,
             accountId: this.accountId,
@@ -192,6 +389,57 @@ export class Income {
     static fromJSON(obj) {
         return new Income(obj);
     }
+
+    /**
+     * Rebuild Income from a trusted record produced by toJSON() (e.g. localStorage).
+     * Skips the constructor: no defaults, no validation. Only the fields listed
+     * here are read, so unknown keys are ignored. Records saved before amounts
+     * were stored in cents (no amountCents) go through fromJSON instead.
+     * @param {Object} obj - Output of Income.prototype.toJSON
+     * @returns {Income}
+     */
+    static fromTrustedJSON(obj) {
+        if (obj.amountCents === undefined) return Income.fromJSON(obj);
+        const i = Object.create(Income.prototype);
+        i.id = obj.id;
+        i.userId = obj.userId;
+        i.date = new Date(obj.date);
+        i.amountCents = obj.amountCents;
+        i.name = obj.name;
+        i.categoryId = obj.categoryId;
+        i.accountId = obj.accountId;
+        i.description = obj.description;
+        i.recurring = obj.recurring;
+        i.dayIncome = obj.dayIncome;
+        i.paymentMethod = internEnumValue(PAYMENT_METHOD_LOOKUP, obj.paymentMethod);
+        i.currency = internEnumValue(CURRENCY_LOOKUP, obj.currency);
+        i.received = obj.received;
+        i.exchangeRate = obj.exchangeRate;
+        i.convertedAmount = obj.convertedAmount;
+        i.attachmentUrl = obj.attachmentUrl;
+        i.tagIds = TagRegistry.internAll(obj.tags);
+        i.notes = obj.notes;
+        i.recurringTemplateId = obj.recurringTemplateId;
+        i.createdAtMs = Date.parse(obj.createdAt);
+        i.updatedAtMs = Date.parse(obj.updatedAt);
+        i.isActive = obj.isActive;
+        return i;
+    }
+
+    /**
+     * Create many Income records sharing one audit timestamp
+     * Lee el reloj una sola vez en lugar de dos veces por registro
+     * @param {Object[]} rows - Income data objects
+     * @returns {Income[]}
+     */
+    static bulkCreate(rows) {
+        const now = Date.now();
+        return rows.map(row => new Income({
+            ...row,
+            createdAt: row.createdAt ?? now,
+            updatedAt: row.updatedAt ?? now
+        }));
+    }
 }
 
 
@@ -204,7 +452,9 @@ export class Expense {
      * @param {number} data.id - Unique identifier
      * @param {number} data.userId - Owner of this expense record
      * @param {Date|string} data.date - Date of expense
-     * @param {number} data.amount - Total amount
+     * @param {number} [data.amountCents] - Total amount in cents (smallest unit)
+     * @param {number} [data.amount] - Total amount, used when amountCents is not given;
+     *     rounded to the nearest cent (10.555 -> 1056, 0.004 -> 0 and rejected)
      * @param {string} data.name - Descriptive name
      * @param {number} data.categoryId - Foreign key to Category
      * @param {number} data.accountId - Foreign key to Account
@@ -219,16 +469,20 @@ export class Expense {
      * @param {number|null} [data.convertedAmount=null] - Converted amount
      * @param {string|null} [data.attachmentUrl=null] - Link to receipt
      * @param {string[]} [data.tags=[]] - Custom tags
+     * @param {number[]} [data.tagIds] - Interned tag ids; take precedence over tags
      * @param {string} [data.notes=''] - Internal notes
      * @param {number|null} [data.recurringTemplateId=null] - Template FK
      * @param {number|null} [data.budgetId=null] - Budget FK
+     * @param {Object} [options]
+     * @param {boolean} [options.validate=true] - Set false for rows already
+     *     validated in bulk (e.g. by TransactionTable.fromRecords)
      */
-    constructor(data) {
+    constructor(data, { validate = true } = {}) {
         // Required fields
         this.id = data.id;
         this.userId = data.userId;
         this.date = data.date instanceof Date ? data.date : new Date(data.date);
-        this.amount = data.amount;
+        this.amountCents = data.amountCents ?? Math.round(data.amount * 100);
         this.name = data.name;
         this.categoryId = data.categoryId;
         this.accountId = data.accountId;
@@ -237,8 +491,8 @@ export class Expense {
         this.description = data.description ?? '';
         this.recurring = data.recurring ?? false;
         this.dayExpense = data.dayExpense ?? null;
-        this.paymentMethod = data.paymentMethod ?? PaymentMethod.CREDIT_CARD;
-        this.currency = data.currency ?? Currency.USD;
+        this.paymentMethod = internEnumValue(PAYMENT_METHOD_LOOKUP, data.paymentMethod ?? PaymentMethod.CREDIT_CARD);
+        this.currency = internEnumValue(CURRENCY_LOOKUP, data.currency ?? Currency.USD);
         this.dueDate = data.dueDate ? (data.dueDate instanceof Date ? data.dueDate : new Date(data.dueDate)) : null;
         this.paid = data.paid ?? false;
 
@@ -248,35 +502,131 @@ export class Expense {
 
         // Additional metadata
         this.attachmentUrl = data.attachmentUrl ?? null;
-        this.tags = data.tags ?? [];
+        this.tagIds = data.tagIds !== undefined
+            ? TagRegistry.freezeIds(data.tagIds)
+            : TagRegistry.internAll(data.tags);
         this.notes = data.notes ?? '';
         this.recurringTemplateId = data.recurringTemplateId ?? null;
         this.budgetId = data.budgetId ?? null;
 
         // Audit fields
-        this.createdAt = data.createdAt ? new Date(data.createdAt) : new Date();
-        this.updatedAt = data.updatedAt ? new Date(data.updatedAt) : new Date();
+        // Guardados como epoch ms; createdAt/updatedAt crean el Date solo al leerlos
+        this.createdAtMs = data.createdAtMs ?? (data.createdAt ? toEpochMs(data.createdAt) : Date.now());
+        this.updatedAtMs = data.updatedAtMs ?? (data.updatedAt ? toEpochMs(data.updatedAt) : Date.now());
         this.isActive = data.isActive ?? true;
 
         // Validate
-        this.#validate();
+        if (validate) this.#validate();
     }
 
     #validate() {
-        if (this.amount <= 0) {
-            throw new Error('Expense amount must be greater than 0');
-        }
-        if (this.dayExpense !== null && (this.dayExpense < 1 || this.dayExpense > 31)) {
-            throw new Error('dayExpense must be between 1 and 31');
-        }
-        if (this.recurring && this.dayExpense === null) {
-            throw new Error('dayExpense is required for recurring expenses');
-        }
-        if (this.dueDate && this.date > this.dueDate) {
+        const day = this.dayExpense;
+
+        // Cada regla se evalúa una sola vez; los registros válidos salen con una comprobación
+        const badAmount = this.amountCents <= 0;
+        const fractionalCents = !Number.isInteger(this.amountCents);
+        const badDay = day !== null && (day < 1 || day > 31);
+        const missingDay = this.recurring && day === null;
+        const pastDue = this.dueDate !== null && this.date > this.dueDate;
+
+        if (badAmount || fractionalCents || badDay || missingDay || pastDue) {
+            if (badAmount) {
+                throw new Error('Expense amount must be greater than 0');
+            }
+            if (fractionalCents) {
+                throw new Error('Expense amountCents must be a whole number of cents');
+            }
+            if (badDay) {
+                throw new Error('dayExpense must be between 1 and 31');
+            }
+            if (missingDay) {
+                throw new Error('dayExpense is required for recurring expenses');
+            }
             throw new Error('Expense date cannot be after dueDate');
         }
     }
 
+    /**
+     * Amount in major units, derived from amountCents
+     * @returns {number}
+     */
+    get amount() {
+        return this.amountCents / 100;
+    }
+
+    set amount(value) {
+        this.amountCents = Math.round(value * 100);
+    }
+
+    /**
+     * @returns {Date}
+     */
+    get createdAt() {
+        return new Date(this.createdAtMs);
+    }
+
+    set createdAt(value) {
+        this.createdAtMs = toEpochMs(value);
+    }
+
+    /**
+     * @returns {Date}
+     */
+    get updatedAt() {
+        return new Date(this.updatedAtMs);
+    }
+
+    set updatedAt(value) {
+        this.updatedAtMs = toEpochMs(value);
+    }
+
+    /**
+     * Tag names, resolved from tagIds. Always frozen: use addTag/removeTag
+     * (or assign a new array) to change them
+     * @returns {ReadonlyArray<string>}
+     */
+    get tags() {
+        if (this.tagIds.length === 0) return EMPTY_TAGS;
+        return Object.freeze(this.tagIds.map(TagRegistry.nameOf));
+    }
+
+    set tags(names) {
+        this.tagIds = TagRegistry.internAll(names);
+    }
+
+    /**
+     * Add a tag (no-op if already present)
+     * @param {string} name
+     */
+    addTag(name) {
+        const id = TagRegistry.intern(name);
+        if (this.tagIds.includes(id)) return;
+        this.tagIds = Object.freeze([...this.tagIds, id]);
+        this.updatedAtMs = Date.now();
+    }
+
+    /**
+     * Remove a tag (no-op if not present)
+     * @param {string} name
+     */
+    removeTag(name) {
+        const id = TagRegistry.idOf(name);
+        if (id === undefined || !this.tagIds.includes(id)) return;
+        const remaining = this.tagIds.filter(tagId => tagId !== id);
+        this.tagIds = remaining.length === 0 ? EMPTY_TAG_IDS : Object.freeze(remaining);
+        this.updatedAtMs = Date.now();
+    }
+
+    /**
+     * Check if this record has a tag
+     * @param {string} name
+     * @returns {boolean}
+     */
+    hasTag(name) {
+        const id = TagRegistry.idOf(name);
+        return id !== undefined && this.tagIds.includes(id);
+    }
+
     /**
      * Calculate amount in account's currency
      * @param {number} rate - Exchange rate
@@ -293,7 +643,7 @@ export class Expense {
      */
     markAsPaid() {
         this.paid = true;
-        this.updatedAt = new Date();
+        this.updatedAtMs = Date.now();
     }
 
     /**
@@ -321,7 +671,7 @@ export class Expense {
             id: this.id,
             userId: this.userId,
             date: this.date.toISOString(),
-            amount: this.amount,
+            amountCents: this.amountCents,
             name: this.name,
             categoryId: this.categoryId,
             accountId: this.accountId,
@@ -348,6 +698,72 @@ export class Expense {
     static fromJSON(obj) {
         return new Expense(obj);
     }
+
+    /**
+     * Rebuild Expense from a trusted record produced by toJSON() (e.g. localStorage).
+     * Skips the constructor: no defaults, no validation. Only the fields listed
+     * here are read, so unknown keys are ignored. Records saved before amounts
+     * were stored in cents (no amountCents) go through fromJSON instead.
+     * @param {Object} obj - Output of Expense.prototype.toJSON
+     * @returns {Expense}
+     */
+    static fromTrustedJSON(obj) {
+        if (obj.amountCents === undefined) return Expense.fromJSON(obj);
+        const e = Object.create(Expense.prototype);
+        e.id = obj.id;
+        e.userId = obj.userId;
+        e.date = new Date(obj.date);
+        e.amountCents = obj.amountCents;
+        e.name = obj.name;
+        e.categoryId = obj.categoryId;
+        e.accountId = obj.accountId;
+        e.description = obj.description;
+        e.recurring = obj.recurring;
+        e.dayExpense = obj.dayExpense;
+        e.paymentMethod = internEnumValue(PAYMENT_METHOD_LOOKUP, obj.paymentMethod);
+        e.currency = internEnumValue(CURRENCY_LOOKUP, obj.currency);
+        e.dueDate = obj.dueDate ? new Date(obj.dueDate) : null;
+        e.paid = obj.paid;
+        e.exchangeRate = obj.exchangeRate;
+        e.convertedAmount = obj.convertedAmount;
+        e.attachmentUrl = obj.attachmentUrl;
+        e.tagIds = TagRegistry.internAll(obj.tags);
+        e.notes = obj.notes;
+        e.recurringTemplateId = obj.recurringTemplateId;
+        e.budgetId = obj.budgetId;
+        e.createdAtMs = Date.parse(obj.createdAt);
+        e.updatedAtMs = Date.parse(obj.updatedAt);
+        e.isActive = obj.isActive;
+        return e;
+    }
+
+    /**
+     * Create many Expense records sharing one audit timestamp
+     * Lee el reloj una sola vez en lugar de dos veces por registro
+     * @param {Object[]} rows - Expense data objects
+     * @returns {Expense[]}
+     */
+    static bulkCreate(rows) {
+        const now = Date.now();
+        return rows.map(row => new Expense({
+            ...row,
+            createdAt: row.createdAt ?? now,
+            updatedAt: row.updatedAt ?? now
+        }));
+    }
+
+    /**
+     * Mark many expenses as paid with a single timestamp
+     * @param {Iterable<Expense>} expenses
+     * @param {Date|number|null} [when=null] - updatedAt applied to every expense (now if omitted)
+     */
+    static markManyPaid(expenses, when = null) {
+        const whenMs = toEpochMs(when ?? Date.now());
+        for (const expense of expenses) {
+            expense.paid = true;
+            expense.updatedAtMs = whenMs;
+        }
+    }
 }
 
 
@@ -361,7 +777,9 @@ export class Transfer {
      * @param {number} data.userId - Owner of both accounts
      * @param {number} data.fromAccountId - Source account
      * @param {number} data.toAccountId - Destination account
-     * @param {number} data.amount - Amount transferred
+     * @param {number} [data.amountCents] - Amount transferred, in cents (smallest unit)
+     * @param {number} [data.amount] - Amount transferred, used when amountCents is not given;
+     *     rounded to the nearest cent (10.555 -> 1056, 0.004 -> 0 and rejected)
      * @param {string} data.fromCurrency - Source currency
      * @param {string} data.toCurrency - Destination currency
      * @param {Date|string} [data.date] - Transfer date
@@ -379,23 +797,27 @@ export class Transfer {
         this.userId = data.userId;
         this.fromAccountId = data.fromAccountId;
         this.toAccountId = data.toAccountId;
-        this.amount = data.amount;
-        this.fromCurrency = data.fromCurrency;
-        this.toCurrency = data.toCurrency;
+        this.amountCents = data.amountCents ?? Math.round(data.amount * 100);
+        this.fromCurrency = internEnumValue(CURRENCY_LOOKUP, data.fromCurrency);
+        this.toCurrency = internEnumValue(CURRENCY_LOOKUP, data.toCurrency);
 
         // Transfer details
         this.date = data.date ? (data.date instanceof Date ? data.date : new Date(data.date)) : new Date();
         this.exchangeRate = data.exchangeRate ?? 1.0;
         this.convertedAmount = data.convertedAmount ?? null;
+        // fee and convertedAmount stay in major units: convertedAmount is the
+        // float result of amount * exchangeRate, and fee is entered as-is by the
+        // user; only the transaction amount itself is stored as integer cents
         this.fee = data.fee ?? 0.0;
         this.description = data.description ?? '';
         this.referenceNumber = data.referenceNumber ?? null;
-        this.status = data.status ?? TransactionStatus.PENDING;
+        this.status = internEnumValue(TRANSACTION_STATUS_LOOKUP, data.status ?? TransactionStatus.PENDING);
         this.notes = data.notes ?? '';
 
         // Audit fields
-        this.createdAt = data.createdAt ? new Date(data.createdAt) : new Date();
-        this.updatedAt = data.updatedAt ? new Date(data.updatedAt) : new Date();
+        // Guardados como epoch ms; createdAt/updatedAt crean el Date solo al leerlos
+        this.createdAtMs = data.createdAtMs ?? (data.createdAt ? toEpochMs(data.createdAt) : Date.now());
+        this.updatedAtMs = data.updatedAtMs ?? (data.updatedAt ? toEpochMs(data.updatedAt) : Date.now());
         this.isActive = data.isActive ?? true;
 
         // Validate and calculate
@@ -403,13 +825,22 @@ export class Transfer {
     }
 
     #validate() {
-        if (this.amount <= 0) {
-            throw new Error('Transfer amount must be greater than 0');
-        }
-        if (this.fromAccountId === this.toAccountId) {
-            throw new Error('Cannot transfer to the same account');
-        }
-        if (this.exchangeRate <= 0) {
+        // Cada regla se evalúa una sola vez; los registros válidos salen con una comprobación
+        const badAmount = this.amountCents <= 0;
+        const fractionalCents = !Number.isInteger(this.amountCents);
+        const sameAccount = this.fromAccountId === this.toAccountId;
+        const badRate = this.exchangeRate <= 0;
+
+        if (badAmount || fractionalCents || sameAccount || badRate) {
+            if (badAmount) {
+                throw new Error('Transfer amount must be greater than 0');
+            }
+            if (fractionalCents) {
+                throw new Error('Transfer amountCents must be a whole number of cents');
+            }
+            if (sameAccount) {
+                throw new Error('Cannot transfer to the same account');
+            }
             throw new Error('Exchange rate must be greater than 0');
         }
 
@@ -419,12 +850,46 @@ export class Transfer {
         }
     }
 
+    /**
+     * Amount in major units, derived from amountCents
+     * @returns {number}
+     */
+    get amount() {
+        return this.amountCents / 100;
+    }
+
+    set amount(value) {
+        this.amountCents = Math.round(value * 100);
+    }
+
+    /**
+     * @returns {Date}
+     */
+    get createdAt() {
+        return new Date(this.createdAtMs);
+    }
+
+    set createdAt(value) {
+        this.createdAtMs = toEpochMs(value);
+    }
+
+    /**
+     * @returns {Date}
+     */
+    get updatedAt() {
+        return new Date(this.updatedAtMs);
+    }
+
+    set updatedAt(value) {
+        this.updatedAtMs = toEpochMs(value);
+    }
+
     /**
      * Mark transfer as completed
      */
     complete() {
         this.status = TransactionStatus.COMPLETED;
-        this.updatedAt = new Date();
+        this.updatedAtMs = Date.now();
     }
 
     /**
@@ -432,7 +897,7 @@ export class Transfer {
      */
     cancel() {
         this.status = TransactionStatus.CANCELLED;
-        this.updatedAt = new Date();
+        this.updatedAtMs = Date.now();
     }
 
     /**
@@ -457,7 +922,7 @@ export class Transfer {
             userId: this.userId,
             fromAccountId: this.fromAccountId,
             toAccountId: this.toAccountId,
-            amount: this.amount,
+            amountCents: this.amountCents,
             fromCurrency: this.fromCurrency,
             toCurrency: this.toCurrency,
             date: this.date.toISOString(),
@@ -477,6 +942,79 @@ export class Transfer {
     static fromJSON(obj) {
         return new Transfer(obj);
     }
+
+    /**
+     * Rebuild Transfer from a trusted record produced by toJSON() (e.g. localStorage).
+     * Skips the constructor: no defaults, no validation. Only the fields listed
+     * here are read, so unknown keys are ignored. Records saved before amounts
+     * were stored in cents (no amountCents) go through fromJSON instead.
+     * @param {Object} obj - Output of Transfer.prototype.toJSON
+     * @returns {Transfer}
+     */
+    static fromTrustedJSON(obj) {
+        if (obj.amountCents === undefined) return Transfer.fromJSON(obj);
+        const t = Object.create(Transfer.prototype);
+        t.id = obj.id;
+        t.userId = obj.userId;
+        t.fromAccountId = obj.fromAccountId;
+        t.toAccountId = obj.toAccountId;
+        t.amountCents = obj.amountCents;
+        t.fromCurrency = internEnumValue(CURRENCY_LOOKUP, obj.fromCurrency);
+        t.toCurrency = internEnumValue(CURRENCY_LOOKUP, obj.toCurrency);
+        t.date = new Date(obj.date);
+        t.exchangeRate = obj.exchangeRate;
+        t.convertedAmount = obj.convertedAmount;
+        t.fee = obj.fee;
+        t.description = obj.description;
+        t.referenceNumber = obj.referenceNumber;
+        t.status = internEnumValue(TRANSACTION_STATUS_LOOKUP, obj.status);
+        t.notes = obj.notes;
+        t.createdAtMs = Date.parse(obj.createdAt);
+        t.updatedAtMs = Date.parse(obj.updatedAt);
+        t.isActive = obj.isActive;
+        return t;
+    }
+
+    /**
+     * Create many Transfer records sharing one audit timestamp
+     * Lee el reloj una sola vez en lugar de dos veces por registro
+     * @param {Object[]} rows - Transfer data objects
+     * @returns {Transfer[]}
+     */
+    static bulkCreate(rows) {
+        const now = Date.now();
+        return rows.map(row => new Transfer({
+            ...row,
+            createdAt: row.createdAt ?? now,
+            updatedAt: row.updatedAt ?? now
+        }));
+    }
+
+    /**
+     * Mark many transfers as completed with a single timestamp
+     * @param {Iterable<Transfer>} transfers
+     * @param {Date|number|null} [when=null] - updatedAt applied to every transfer (now if omitted)
+     */
+    static completeMany(transfers, when = null) {
+        const whenMs = toEpochMs(when ?? Date.now());
+        for (const transfer of transfers) {
+            transfer.status = TransactionStatus.COMPLETED;
+            transfer.updatedAtMs = whenMs;
+        }
+    }
+
+    /**
+     * Cancel many transfers with a single timestamp
+     * @param {Iterable<Transfer>} transfers
+     * @param {Date|number|null} [when=null] - updatedAt applied to every transfer (now if omitted)
+     */
+    static cancelMany(transfers, when = null) {
+        const whenMs = toEpochMs(when ?? Date.now());
+        for (const transfer of transfers) {
+            transfer.status = TransactionStatus.CANCELLED;
+            transfer.updatedAtMs = whenMs;
+        }
+    }
 }
 
 
@@ -488,7 +1026,7 @@ export class Transfer {
  * @returns {boolean}
  */
 export function validateCurrency(currency) {
-    return Object.values(Currency).includes(currency);
+    return CURRENCY_LOOKUP.has(currency);
 }
 
 /**
@@ -497,7 +1035,7 @@ export function validateCurrency(currency) {
  * @returns {boolean}
  */
 export function validatePaymentMethod(method) {
-    return Object.values(PaymentMethod).includes(method);
+    return PAYMENT_METHOD_LOOKUP.has(method);
 }
 
 /**
@@ -0,0 +1,404 @@
+/**
+ * transactionTable.js - Columnar (SoA) store for FinanceTrack transactions
+ *
+ * Keeps Income/Expense data as parallel typed arrays so reports can
+ * aggregate in tight loops instead of walking lists of model objects.
+ */
+
+import { validateCurrency, validatePaymentMethod } from './models.js';
+
+const MS_PER_DAY = 1000 * 60 * 60 * 24;
+
+// Los códigos de diccionario se guardan en Uint8Array
+const MAX_DICTIONARY_SIZE = 256;
+
+// Días y meses se agrupan por fecha de calendario LOCAL (como getDaysUntilDue
+// en models.js), así new Date(2025, 1, 1) cae en '2025-02' en cualquier zona horaria.
+
+/**
+ * @param {Date|string} value
+ * @returns {Date}
+ */
+function toDate(value) {
+    return value instanceof Date ? value : new Date(value);
+}
+
+/**
+ * Convert a Date to a day number of its local calendar date
+ * (days since epoch, like datetime64[D])
+ * @param {Date} date
+ * @returns {number}
+ */
+function toDayNumber(date) {
+    return Math.floor(Date.UTC(date.getFullYear(), date.getMonth(), date.getDate()) / MS_PER_DAY);
+}
+
+/**
+ * Convert a Date to a month number of its local calendar date (year * 12 + month)
+ * @param {Date} date
+ * @returns {number}
+ */
+function toMonthNumber(date) {
+    return date.getFullYear() * 12 + date.getMonth();
+}
+
+/**
+ * Dictionary-encode a value, adding it to the dictionary if new
+ * @param {Array} dictionary - Code -> value
+ * @param {Map} index - Value -> code
+ * @param {*} value
+ * @returns {number} Code for value
+ */
+function encode(dictionary, index, value) {
+    let code = index.get(value);
+    if (code === undefined) {
+        code = dictionary.length;
+        if (code >= MAX_DICTIONARY_SIZE) {
+            throw new Error(`Too many distinct values for a dictionary column (max ${MAX_DICTIONARY_SIZE})`);
+        }
+        dictionary.push(value);
+        index.set(value, code);
+    }
+    return code;
+}
+
+/**
+ * Group row indices by key in two passes (count, then fill)
+ * @param {Float64Array} keys
+ * @returns {Map<number, Int32Array>} Key -> ascending row indices
+ */
+function buildIndex(keys) {
+    const counts = new Map();
+    for (let i = 0; i < keys.length; i++) {
+        counts.set(keys[i], (counts.get(keys[i]) ?? 0) + 1);
+    }
+    const index = new Map();
+    const fill = new Map();
+    for (const [key, count] of counts) {
+        index.set(key, new Int32Array(count));
+        fill.set(key, 0);
+    }
+    for (let i = 0; i < keys.length; i++) {
+        const key = keys[i];
+        const pos = fill.get(key);
+        index.get(key)[pos] = i;
+        fill.set(key, pos + 1);
+    }
+    return index;
+}
+
+/**
+ * Multiply amounts by rates element-wise into a preallocated output,
+ * rounding each result to whole cents.
+ * Bucle monomórfico sobre TypedArrays para que el JIT lo optimice.
+ * @param {Float64Array} amounts
+ * @param {Float64Array} rates
+ * @param {Float64Array} out
+ */
+function batchConvert(amounts, rates, out) {
+    const n = out.length;
+    for (let i = 0; i < n; i++) {
+        out[i] = Math.round(amounts[i] * rates[i]);
+    }
+}
+
+
+// ==================== TRANSACTION TABLE ====================
+
+/**
+ * Structure-of-arrays view over a list of Income or Expense records.
+ * Cada columna es un TypedArray contiguo; la fila i de todas las columnas
+ * corresponde al mismo registro.
+ */
+export class TransactionTable {
+    // Índices invertidos, construidos en la primera consulta.
+    // Si se escriben categoryIds/accountIds después, llamar invalidateIndexes()
+    #byCategory = null;
+    #byAccount = null;
+
+    /**
+     * @param {number} length - Number of rows to allocate
+     */
+    constructor(length) {
+        this.length = length;
+
+        // Numeric columns
+        // Ids from generateId() exceed int32, so every id/foreign-key column is Float64
+        this.ids = new Float64Array(length);
+        this.userIds = new Float64Array(length);
+        // Amounts (original and converted) are integer cents; Float64Array holds them exactly up to 2^53
+        this.amountCents = new Float64Array(length);
+        this.convertedAmountCents = new Float64Array(length);
+        this.categoryIds = new Float64Array(length);
+        this.accountIds = new Float64Array(length);
+        this.dates = new Int32Array(length);
+        this.months = new Int32Array(length);
+        // 1 if paid (Expense) or received (Income)
+        this.settled = new Uint8Array(length);
+
+        // Dictionary-encoded columns: codes per row + one dictionary per column
+        this.currencyCodes = new Uint8Array(length);
+        this.currencyDictionary = [];
+        this.paymentMethodCodes = new Uint8Array(length);
+        this.paymentMethodDictionary = [];
+
+        // String columns
+        this.names = new Array(length);
+    }
+
+    /**
+     * Fill every column from a list of records in a single pass
+     * @param {Array<Income|Expense>} records
+     * @returns {TransactionTable}
+     */
+    static #fill(records) {
+        const table = new TransactionTable(records.length);
+        const currencyIndex = new Map();
+        const paymentMethodIndex = new Map();
+        for (let i = 0; i < records.length; i++) {
+            const r = records[i];
+            const date = toDate(r.date);
+            table.ids[i] = r.id;
+            table.userIds[i] = r.userId;
+            table.amountCents[i] = r.amountCents ?? Math.round(r.amount * 100);
+            table.convertedAmountCents[i] = r.convertedAmount === null || r.convertedAmount === undefined
+                ? NaN
+                : Math.round(r.convertedAmount * 100);
+            table.categoryIds[i] = r.categoryId;
+            table.accountIds[i] = r.accountId;
+            table.dates[i] = toDayNumber(date);
+            table.months[i] = toMonthNumber(date);
+            table.settled[i] = r.paid || r.received ? 1 : 0;
+            table.currencyCodes[i] = encode(table.currencyDictionary, currencyIndex, r.currency);
+            table.paymentMethodCodes[i] = encode(table.paymentMethodDictionary, paymentMethodIndex, r.paymentMethod);
+            table.names[i] = r.name;
+        }
+        return table;
+    }
+
+    /**
+     * @param {Income[]} incomes
+     * @returns {TransactionTable}
+     */
+    static fromIncomes(incomes) {
+        return TransactionTable.#fill(incomes);
+    }
+
+    /**
+     * @param {Expense[]} expenses
+     * @returns {TransactionTable}
+     */
+    static fromExpenses(expenses) {
+        return TransactionTable.#fill(expenses);
+    }
+
+    /**
+     * Build a table from raw, not yet validated rows (e.g. a CSV import).
+     * Validates all rows together and throws once listing every bad index,
+     * instead of constructing and validating one model per row.
+     * @param {Object[]} rows - Plain objects with Income or Expense fields
+     * @returns {TransactionTable}
+     */
+    static fromRecords(rows) {
+        // Validar antes de llenar, para que valores desconocidos no lleguen a los diccionarios
+        const bad = [];
+        for (let i = 0; i < rows.length; i++) {
+            const row = rows[i];
+            const day = row.dayIncome ?? row.dayExpense ?? null;
+            const cents = row.amountCents ?? Math.round(row.amount * 100);
+            if (Number.isNaN(toDate(row.date).getTime())
+                || !(cents > 0)
+                || !Number.isInteger(cents)
+                || (day !== null && (day < 1 || day > 31))
+                || (row.recurring && day === null)
+                || (row.dueDate && toDate(row.date) > toDate(row.dueDate))
+                || (row.currency !== undefined && !validateCurrency(row.currency))
+                || (row.paymentMethod !== undefined && !validatePaymentMethod(row.paymentMethod))) {
+                bad.push(i);
+            }
+        }
+        if (bad.length > 0) {
+            throw new Error(`Invalid rows: ${bad.join(', ')}`);
+        }
+        return TransactionTable.#fill(rows);
+    }
+
+    /**
+     * Recompute convertedAmountCents for every row in one pass
+     * @param {number|Float64Array|number[]} rates - Single rate or one rate per row
+     * @returns {Float64Array} The updated convertedAmountCents column
+     */
+    applyExchangeRates(rates) {
+        let rateColumn;
+        if (typeof rates === 'number') {
+            rateColumn = new Float64Array(this.length).fill(rates);
+        } else if (rates instanceof Float64Array) {
+            rateColumn = rates;
+        } else {
+            rateColumn = Float64Array.from(rates);
+        }
+        if (rateColumn.length !== this.length) {
+            throw new Error('rates length must match table length');
+        }
+        batchConvert(this.amountCents, rateColumn, this.convertedAmountCents);
+        return this.convertedAmountCents;
+    }
+
+    /**
+     * Sum amounts grouped by category (equivalent to np.bincount with weights).
+     * Reuses the cached category index, so repeated calls skip the grouping pass.
+     * @param {Uint8Array|null} [mask=null] - Optional row filter
+     * @returns {Map<number, number>} Totals in cents keyed by categoryId
+     */
+    sumByCategory(mask = null) {
+        const totals = new Map();
+        for (const [categoryId, rows] of this.#categoryIndex()) {
+            let total = 0;
+            for (let i = 0; i < rows.length; i++) {
+                const row = rows[i];
+                if (mask === null || mask[row]) total += this.amountCents[row];
+            }
+            totals.set(categoryId, total);
+        }
+        return totals;
+    }
+
+    /**
+     * Sum amounts grouped by month
+     * @param {Uint8Array|null} [mask=null] - Optional row filter
+     * @returns {Map<string, number>} Totals in cents keyed by 'YYYY-MM'
+     */
+    sumByMonth(mask = null) {
+        const byMonth = new Map();
+        for (let i = 0; i < this.length; i++) {
+            if (mask === null || mask[i]) {
+                const month = this.months[i];
+                byMonth.set(month, (byMonth.get(month) ?? 0) + this.amountCents[i]);
+            }
+        }
+        const totals = new Map();
+        for (const month of [...byMonth.keys()].sort((a, b) => a - b)) {
+            const key = `${Math.floor(month / 12)}-${String(month % 12 + 1).padStart(2, '0')}`;
+            totals.set(key, byMonth.get(month));
+        }
+        return totals;
+    }
+
+    /**
+     * Sum amounts grouped by original currency
+     * @param {Uint8Array|null} [mask=null] - Optional row filter
+     * @returns {Map<string, number>} Totals in cents keyed by currency code
+     */
+    sumByCurrency(mask = null) {
+        const byCode = new Float64Array(this.currencyDictionary.length);
+        for (let i = 0; i < this.length; i++) {
+            if (mask === null || mask[i]) byCode[this.currencyCodes[i]] += this.amountCents[i];
+        }
+        const totals = new Map();
+        for (let code = 0; code < byCode.length; code++) {
+            totals.set(this.currencyDictionary[code], byCode[code]);
+        }
+        return totals;
+    }
+
+    /**
+     * Drop the cached category/account indexes so the next query rebuilds them.
+     * Call after writing to categoryIds or accountIds.
+     */
+    invalidateIndexes() {
+        this.#byCategory = null;
+        this.#byAccount = null;
+    }
+
+    /**
+     * @returns {Map<number, Int32Array>} Cached categoryId -> row indices
+     */
+    #categoryIndex() {
+        this.#byCategory ??= buildIndex(this.categoryIds);
+        return this.#byCategory;
+    }
+
+    /**
+     * @returns {Map<number, Int32Array>} Cached accountId -> row indices
+     */
+    #accountIndex() {
+        this.#byAccount ??= buildIndex(this.accountIds);
+        return this.#byAccount;
+    }
+
+    /**
+     * Row indices for a category (index is built once, on first query)
+     * @param {number} categoryId
+     * @returns {Int32Array} A copy; writing to it does not affect the index
+     */
+    indicesForCategory(categoryId) {
+        return this.#categoryIndex().get(categoryId)?.slice() ?? new Int32Array(0);
+    }
+
+    /**
+     * Row indices for an account (index is built once, on first query)
+     * @param {number} accountId
+     * @returns {Int32Array} A copy; writing to it does not affect the index
+     */
+    indicesForAccount(accountId) {
+        return this.#accountIndex().get(accountId)?.slice() ?? new Int32Array(0);
+    }
+
+    /**
+     * Total for one category, touching only that category's rows
+     * @param {number} categoryId
+     * @returns {number} Total in cents
+     */
+    sumForCategory(categoryId) {
+        return this.#sumRows(this.#categoryIndex().get(categoryId));
+    }
+
+    /**
+     * Total for one account, touching only that account's rows
+     * @param {number} accountId
+     * @returns {number} Total in cents
+     */
+    sumForAccount(accountId) {
+        return this.#sumRows(this.#accountIndex().get(accountId));
+    }
+
+    /**
+     * @param {Int32Array|undefined} rows
+     * @returns {number}
+     */
+    #sumRows(rows) {
+        if (rows === undefined) return 0;
+        let total = 0;
+        for (let i = 0; i < rows.length; i++) total += this.amountCents[rows[i]];
+        return total;
+    }
+
+    /**
+     * Boolean mask of rows whose local calendar date falls within [from, to]
+     * @param {Date} from - Inclusive start date
+     * @param {Date} to - Inclusive end date
+     * @returns {Uint8Array}
+     */
+    dateRangeMask(from, to) {
+        const start = toDayNumber(from);
+        const end = toDayNumber(to);
+        const mask = new Uint8Array(this.length);
+        for (let i = 0; i < this.length; i++) {
+            mask[i] = this.dates[i] >= start && this.dates[i] <= end ? 1 : 0;
+        }
+        return mask;
+    }
+
+    /**
+     * Sum of amounts, optionally restricted by a mask
+     * @param {Uint8Array|null} [mask=null]
+     * @returns {number} Total in cents
+     */
+    sum(mask = null) {
+        let total = 0;
+        for (let i = 0; i < this.length; i++) {
+            if (mask === null || mask[i]) total += this.amountCents[i];
+        }
+        return total;
+    }
+}